@@ -70,7 +70,7 @@ class Axes(DrawableContainer):
 
 
             
-    def _getViewport(self, boundingRect: Tuple[float, float, float, float]) -> Tuple[float, float, float, float]:
+    def _getViewport(self, boundingRect: Optional[Tuple[float, float, float, float]]) -> Tuple[float, float, float, float]:
         """Calculates the final viewport limits, applying auto-limits and padding."""
         xLim = self._calcXLim(boundingRect)
         yLim = self._calcYLim(boundingRect)
@@ -100,6 +100,8 @@ class Axes(DrawableContainer):
             
     def _beginZoomOrPan(self) -> None:
         """Freezes auto limits before zooming/panning starts."""
+        if not (self._xLimAuto or self._yLimAuto):
+            return
         boundingRect = self._calcBoundingRect()
         if self._xLimAuto:
             self._xLim = self._calcXLim(boundingRect)
@@ -145,7 +147,8 @@ class Axes(DrawableContainer):
         innerRect_h = dst_h - self._topMargin - self._bottomMargin
         innerRect = (innerRect_x, innerRect_y, innerRect_w, innerRect_h)
         
-        boundingRect = self._calcBoundingRect()
+        # The bounding rect is only needed for auto limits, skip the drawable traversal otherwise
+        boundingRect = self._calcBoundingRect() if self._xLimAuto or self._yLimAuto else None
         viewport = self._getViewport(boundingRect)
         
         if self._fixedAspectRatio:
@@ -177,6 +180,11 @@ class Axes(DrawableContainer):
         
         if self._fixedAspectRatio:
             scalex = scaley = math.sqrt(scalex * scaley)
+
+        if scalex == 1.0 and scaley == 1.0:
+            # Nothing moves, but keep the limits normalized like a real zoom/pan does
+            self._normalizeLims()
+            return
             
         rawProjection = self._getRawProjection(size)
         
@@ -204,18 +212,24 @@ class Axes(DrawableContainer):
     def pan(self, size: Tuple[int, int], delta: Tuple[int, int]) -> None:
         """Pans the view based on a pixel delta."""
         self._beginZoomOrPan()
+
+        if delta[0] == 0 and delta[1] == 0:
+            self._normalizeLims()
+            return
         
         rawProjection = self._getRawProjection(size)
         
         if rawProjection.area == 0: return
-            
-        topLeftPix0 = rawProjection.project((self._xLim[0], self._yLim[0]), False)
-        bottomRightPix0 = rawProjection.project((self._xLim[1], self._yLim[1]), False)
         
-        topLeftPix = (topLeftPix0[0] - delta[0], topLeftPix0[1] - delta[1])
-        bottomRightPix = (bottomRightPix0[0] - delta[0], bottomRightPix0[1] - delta[1])
+        # The projection is linear, so shifting by delta pixels shifts both limits by delta / k
+        # (no need for the project/unproject round trip)
+        dx = delta[0] / rawProjection.kx
+        dy = delta[1] / rawProjection.ky
         
-        self._setLimsFromPoints(rawProjection, topLeftPix, bottomRightPix)
+        self._xLim = (self._xLim[0] - dx, self._xLim[1] - dx)
+        self._yLim = (self._yLim[0] - dy, self._yLim[1] - dy)
+        
+        self._normalizeLims()
 
     def setTransformation(self, transformation: Optional[Transformation]) -> 'Axes':
         """Sets a new coordinate transformation, preserving current limits in data space."""
@@ -257,12 +271,17 @@ class Axes(DrawableContainer):
             mat.fill(255)
         
         renderTarget = RenderTarget(rawProjection, mat)
+        # Scratch target for transparent drawables, allocated once and reused for all of them
+        alphaTarget = None
         
         for drawable in self.drawables():
             if drawable.alpha < 1.0:
-                rt = RenderTarget(rawProjection, renderTarget.outerMat().copy())
-                drawable.render(rt)
-                renderTarget.outerMat()[:,:] = cv2.addWeighted(renderTarget.outerMat(), 1-drawable.alpha, rt.outerMat(), drawable.alpha, 0)
+                if alphaTarget is None:
+                    alphaTarget = RenderTarget(rawProjection, mat.copy())
+                else:
+                    np.copyto(alphaTarget.outerMat(), mat)
+                drawable.render(alphaTarget)
+                cv2.addWeighted(mat, 1-drawable.alpha, alphaTarget.outerMat(), drawable.alpha, 0, dst=mat)
             else:
                 drawable.render(renderTarget)
 
@@ -2,6 +2,9 @@ import numpy as np
 from cv_plot.core.transformation import Transformation
 
 class RawProjection():
+    # Created for every render/pan/zoom and read on every project() call, so skip the instance dict
+    __slots__ = ('offset', 'kx', 'ky', 'transformation', 'inner_rect')
+
     def __init__(self, offset=(0.0, 0.0), kx=1.0, ky=1.0, 
                  transformation: Transformation = None, inner_rect=None):
         # Equivalent to cv::Point2d offset (using a tuple/list)
@@ -58,6 +61,8 @@ class RawProjection():
         return self.inner_rect[2] * self.inner_rect[3]
 
 class Projection():
+    __slots__ = ('_rawProjection',)
+
     def __init__(self, rawProjection : RawProjection):
         self._rawProjection = rawProjection
 
@@ -77,6 +82,8 @@ class Projection():
         return (inner[0] + self._rawProjection.inner_rect[0], inner[1] + self._rawProjection.inner_rect[1])
 
 class RenderTarget(Projection):
+    __slots__ = ('_outerMat', '_innerMat')
+
     def __init__(self, rawProjection : RawProjection, outerMat : np.ndarray):
         super().__init__(rawProjection)
         x,y,w,h = rawProjection.inner_rect
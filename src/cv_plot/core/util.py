@@ -91,6 +91,10 @@ def _pixel_text(data: np.ndarray, row: int, col: int,
 
 # --- Core Utility Functions (Equivalent to CvPlot::Internal::* in .cpp) ---
 
+# Powers of 10 used by digits(), precomputed as it runs for every tick label on each render
+_POW10 = tuple(math.pow(10, i) for i in range(11))
+_NEG_POW10 = tuple(math.pow(10, -i) for i in range(11))
+
 def digits(value: float) -> int:
     """
     Equivalent to digits(double value). Calculates the number of significant 
@@ -102,8 +106,8 @@ def digits(value: float) -> int:
     
     # C++: std::abs(value - rounded) / step < epsilon
     for i in range(11): # Loop up to 10 significant digits
-        step = math.pow(10, -i)
-        rounded = round(value * math.pow(10, i)) * step
+        step = _NEG_POW10[i]
+        rounded = round(value * _POW10[i]) * step
         
         # The C++ error calculation is complex; simplified logic: 
         # check if value is close to the rounded version scaled by the step.